@@ -18,7 +18,7 @@ from src.data.models import (
 )
 
 # Import Yahoo Finance adapter
-from src.tools.yahoo_finance import yf_get_prices, yf_get_financial_metrics, yf_get_insider_trades
+from src.tools.yahoo_finance import yf_get_prices, yf_get_prices_frame, yf_get_financial_metrics, yf_get_insider_trades
 
 # Global cache instance
 _cache = get_cache()
@@ -320,5 +320,15 @@ def prices_to_df(prices: list[Price]) -> pd.DataFrame:
 
 # Update the get_price_data function to use the new functions
 def get_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    # The Yahoo Finance adapter can serve the frame straight from its columnar
+    # cache without building Price objects row by row
+    if USE_YAHOO_FINANCE:
+        try:
+            df = yf_get_prices_frame(ticker, start_date, end_date)
+            if not df.empty:
+                return df
+        except Exception as e:
+            logger.warning(f"Error fetching price frame from Yahoo Finance: {str(e)}")
+
     prices = get_prices(ticker, start_date, end_date)
     return prices_to_df(prices)
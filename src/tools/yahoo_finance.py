@@ -5,29 +5,363 @@ This module provides functions to fetch financial data from Yahoo Finance,
 transforming the results to match the data models expected by the application.
 """
 
+import asyncio
+import bisect
+import functools
+import hashlib
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union
 
+import numpy as np
+import requests
 import yfinance as yf
 import pandas as pd
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.data.models import Price, FinancialMetrics, InsiderTrade
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so repeated Yahoo Finance calls reuse pooled keep-alive
+# connections instead of paying a fresh TCP+TLS handshake per request
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+
+@functools.lru_cache(maxsize=512)
+def _ticker(symbol: str) -> yf.Ticker:
+    """
+    One yf.Ticker per symbol, shared across all fetch functions.
+
+    yfinance lazily caches quote/crumb state on the instance, so reusing it
+    avoids re-authenticating and re-fetching state per endpoint.
+    """
+    return yf.Ticker(symbol, session=_session)
+
+class BoundedCache:
+    """
+    LRU-bounded in-memory cache with conditional replacement.
+
+    Entries are evicted least-recently-used once maxsize is reached, and an
+    existing entry is only overwritten when the incoming payload carries at
+    least as many rows — a fresher-but-sparser fetch never clobbers a richer
+    one.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._maxsize = maxsize
+        # Callers fan out over threads (scripts, async wrappers), so every
+        # structural mutation happens under the lock
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: str):
+        """Return the cached value for key (marking it recently used), or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value):
+        """Store value under key unless a higher-cardinality entry already exists."""
+        with self._lock:
+            existing = self._data.get(key)
+            if existing is not None and len(existing) > len(value):
+                self._data.move_to_end(key)
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
 # Cache to store retrieved data and reduce API calls
-_cache: Dict[str, Dict[str, Any]] = {
-    "prices": {},
-    "financial_metrics": {},
-    "line_items": {},
-    "market_cap": {},
-    "insider_trades": {},
+_cache: Dict[str, BoundedCache] = {
+    "prices": BoundedCache(),
+    "financial_metrics": BoundedCache(),
+    "line_items": BoundedCache(),
+    "market_cap": BoundedCache(),
+    "insider_trades": BoundedCache(),
+    "price_series": BoundedCache(),
 }
 
+# On-disk cache so results survive process restarts (the demo scripts re-hit
+# Yahoo for the same tickers on every run otherwise). YF_CACHE_DIR lets
+# parallel workers (e.g. pytest-xdist, CI shards) point at isolated dirs.
+_CACHE_DIR = Path(os.environ.get("YF_CACHE_DIR", ".cache"))
+
+# Bounds concurrent Yahoo Finance calls from the async wrappers so a wide
+# gather cannot stampede the API. Semaphores bind to the loop that first
+# waits on them, so one is created lazily per running event loop — a
+# module-level instance would break the second asyncio.run() in a process.
+_ASYNC_CONCURRENCY = 16
+_loop_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _async_sem() -> asyncio.Semaphore:
+    """Return the concurrency semaphore for the current event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _loop_sems.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+        _loop_sems[loop] = sem
+    return sem
+
+# Coalesces concurrent fetches of the same price window into one network
+# call: the second caller awaits the first caller's Future instead of
+# issuing a duplicate request
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yf-fetch")
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Optional predictive prefetch: after a window is fetched, warm the cache
+# with a wider one in the background, since a request for the last 30 days
+# is usually followed by one for a longer lookback. Off by default so call
+# counts stay deterministic for tests and one-shot scripts.
+_PREFETCH_ENABLED = os.environ.get("YF_PREFETCH", "false").lower() == "true"
+_PREFETCH_PAD_DAYS = 180
+_prefetched: set = set()
 
-def yf_get_prices(ticker: str, start_date: str, end_date: str) -> List[Price]:
+# Per-ticker list of (start_date, end_date, cache_key) for cached price
+# windows, so a narrower query can be answered by slicing a wider one.
+# Registrations happen on executor threads while lookups run on caller
+# threads, so all access goes through _ranges_lock.
+_price_ranges: Dict[str, List[tuple]] = {}
+_ranges_lock = threading.Lock()
+
+
+def _register_price_range(ticker: str, start_date: str, end_date: str, cache_key: str):
+    """Record a cached price window, dropping windows the new one covers."""
+    with _ranges_lock:
+        ranges = _price_ranges.setdefault(ticker, [])
+        ranges[:] = [r for r in ranges if not (start_date <= r[0] and r[1] <= end_date)]
+        ranges.append((start_date, end_date, cache_key))
+
+
+def _covering_prices(ticker: str, start_date: str, end_date: str) -> Optional[List[Price]]:
+    """Slice the requested window out of a cached superset range, if one exists."""
+    with _ranges_lock:
+        candidates = list(_price_ranges.get(ticker, []))
+    stale = []
+    try:
+        for entry in candidates:
+            range_start, range_end, key = entry
+            if range_start <= start_date and end_date <= range_end:
+                prices = _cache["prices"].get(key)
+                if prices is None:
+                    # evicted from the LRU since registration
+                    stale.append(entry)
+                    continue
+                lo = bisect.bisect_left(prices, start_date, key=lambda p: p.time)
+                hi = bisect.bisect_right(prices, end_date, key=lambda p: p.time)
+                return prices[lo:hi]
+        return None
+    finally:
+        if stale:
+            with _ranges_lock:
+                ranges = _price_ranges.get(ticker, [])
+                for entry in stale:
+                    if entry in ranges:
+                        ranges.remove(entry)
+
+DateLike = Union[str, datetime, date]
+
+
+def _normalize_date(value: Optional[DateLike]) -> Optional[str]:
+    """Normalize str/date/datetime inputs to the canonical YYYY-MM-DD string."""
+    if value is None or isinstance(value, str):
+        return value
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+# FinancialMetrics fields that Yahoo Finance reports as fractions; each is
+# scaled to a percentage, with missing values mapped to None
+_PCT_FIELDS = [
+    ('gross_margin', 'grossMargins'),
+    ('operating_margin', 'operatingMargins'),
+    ('net_margin', 'profitMargins'),
+    ('return_on_equity', 'returnOnEquity'),
+    ('return_on_assets', 'returnOnAssets'),
+    ('revenue_growth', 'revenueGrowth'),
+    ('earnings_growth', 'earningsGrowth'),
+    ('earnings_per_share_growth', 'earningsQuarterlyGrowth'),
+    ('payout_ratio', 'payoutRatio'),
+]
+
+
+def file_cached(endpoint: str, ttl_days: int, model):
+    """
+    Persist a yf_get_* function's results as JSON under .cache/<endpoint>/.
+
+    The wrapper checks the in-memory cache, then the disk cache (honoring a
+    per-endpoint TTL matched to the data's cadence), and only then calls
+    through to Yahoo Finance. Successful results are written atomically
+    (tmp file + rename) so a crashed run never leaves a truncated entry.
+
+    Args:
+        endpoint: Key into the in-memory _cache and the on-disk subdirectory
+        ttl_days: How long a disk entry stays fresh
+        model: Pydantic model used to revalidate entries read from disk
+    """
+    def decorator(func):
+        # One adapter per endpoint: validate_json/dump_json handle the whole
+        # list in a single pydantic-core pass instead of N per-item calls
+        list_adapter = TypeAdapter(List[model])
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Normalize date-like args so object and string calls for the
+            # same window share one cache entry
+            key = "_".join(
+                [str(_normalize_date(a)) if isinstance(a, (datetime, date)) else str(a) for a in args]
+                + [str(v) for _, v in sorted(kwargs.items())]
+            )
+            cached = _cache[endpoint].get(key)
+            if cached is not None:
+                return cached
+
+            path = _CACHE_DIR / endpoint / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+            if path.exists() and time.time() - path.stat().st_mtime < ttl_days * 86400:
+                try:
+                    result = list_adapter.validate_json(path.read_bytes())
+                    _cache[endpoint].put(key, result)
+                    logger.info(f"Using disk-cached {endpoint} for {args[0]}")
+                    return result
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable cache entry {path}: {str(e)}")
+
+            result = func(*args, **kwargs)
+
+            if result:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    # Unique tmp file per writer: coalesced callers can reach
+                    # this block simultaneously, and a shared tmp name lets one
+                    # writer publish another's half-written file
+                    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(list_adapter.dump_json(result))
+                    os.replace(tmp_name, path)
+                except Exception as e:
+                    logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+
+            return result
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True, frozen=True)
+class PricePoint:
+    """
+    Lightweight OHLCV row for the internal hot path.
+
+    Attribute-compatible with the Pydantic Price model but several times
+    cheaper to allocate; use Price (via PriceSeries.to_list) wherever rows
+    cross the public API boundary, e.g. anything that calls model_dump().
+    """
+
+    open: float
+    close: float
+    high: float
+    low: float
+    volume: int
+    time: str
+
+
+@dataclass(slots=True)
+class PriceSeries:
+    """
+    Columnar OHLCV container (struct-of-arrays).
+
+    Holds one numpy array per field and materializes rows lazily on access,
+    so a multi-year history costs five arrays instead of one object per row.
+    """
+
+    opens: np.ndarray
+    highs: np.ndarray
+    lows: np.ndarray
+    closes: np.ndarray
+    volumes: np.ndarray
+    times: List[str]
+
+    def __len__(self) -> int:
+        return len(self.opens)
+
+    def __getitem__(self, i: int) -> PricePoint:
+        return PricePoint(
+            open=float(self.opens[i]),
+            close=float(self.closes[i]),
+            high=float(self.highs[i]),
+            low=float(self.lows[i]),
+            volume=int(self.volumes[i]),
+            time=self.times[i],
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_list(self) -> List[Price]:
+        """Materialize the whole series as a list of Price objects."""
+        # tolist() hands back native Python scalars in one C pass, which keeps
+        # the unvalidated model_construct instances JSON-serializable downstream
+        return [
+            Price.model_construct(open=o, close=c, high=h, low=l, volume=v, time=t)
+            for o, c, h, l, v, t in zip(self.opens.tolist(), self.closes.tolist(), self.highs.tolist(), self.lows.tolist(), self.volumes.tolist(), self.times)
+        ]
+
+
+def _price_series_from_df(df: pd.DataFrame) -> PriceSeries:
+    """Build a PriceSeries from a yfinance OHLCV frame with vectorized ops."""
+    # Drop incomplete rows (NaN OHLCV) so the integer coercion below cannot
+    # silently produce garbage volumes
+    df = df.dropna(subset=['Open', 'High', 'Low', 'Close', 'Volume'])
+
+    # Materialize the frame once as a single contiguous ndarray and slice
+    # columns by integer position; this avoids both per-row Series boxing
+    # (iterrows) and per-column block-manager dispatch on the hot path.
+    col_idx = df.columns.get_indexer(['Open', 'High', 'Low', 'Close', 'Volume'])
+    arr = df.values
+    opens, highs, lows, closes, volumes = (arr[:, i] for i in col_idx)
+    # One column-level cast instead of O(rows) Python int() calls
+    volumes = volumes.astype('int64', copy=False)
+    # Format dates in pure numpy, skipping Python datetime entirely; strip the
+    # exchange timezone first so wall-clock dates don't shift through UTC
+    idx = df.index.tz_localize(None) if df.index.tz is not None else df.index
+    times = np.datetime_as_string(idx.values, unit='D').tolist()
+    return PriceSeries(opens=opens, highs=highs, lows=lows, closes=closes, volumes=volumes, times=times)
+
+
+@file_cached(endpoint="prices", ttl_days=7, model=Price)
+def yf_get_prices(ticker: str, start_date: DateLike, end_date: DateLike) -> List[Price]:
     """
     Get historical price data from Yahoo Finance.
     
@@ -39,36 +373,77 @@ def yf_get_prices(ticker: str, start_date: str, end_date: str) -> List[Price]:
     Returns:
         List of Price objects
     """
+    # Accept date/datetime objects and convert exactly once at the boundary
+    start_date = _normalize_date(start_date)
+    end_date = _normalize_date(end_date)
     cache_key = f"{ticker}_{start_date}_{end_date}"
-    if cache_key in _cache["prices"]:
+    cached = _cache["prices"].get(cache_key)
+    if cached is not None:
         logger.info(f"Using cached price data for {ticker}")
-        return _cache["prices"][cache_key]
-    
+        return cached
+
+    # A wider cached window can answer the query without a refetch
+    covering = _covering_prices(ticker, start_date, end_date)
+    if covering is not None:
+        logger.info(f"Serving cached superset price range for {ticker}")
+        return covering
+
+    # Coalesce with any identical fetch already in flight
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        is_owner = future is None
+        if is_owner:
+            future = _executor.submit(_fetch_prices, ticker, start_date, end_date, cache_key)
+            _inflight[cache_key] = future
+    try:
+        prices = future.result()
+    finally:
+        if is_owner:
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+
+    # Warm the cache with a wider window in the background (once per ticker);
+    # the range registry then serves follow-up lookback queries by slicing
+    if _PREFETCH_ENABLED and is_owner and prices:
+        with _inflight_lock:
+            should_prefetch = ticker not in _prefetched
+            if should_prefetch:
+                _prefetched.add(ticker)
+        if should_prefetch:
+            _executor.submit(_prefetch_wider_range, ticker, start_date, end_date)
+
+    return prices
+
+
+def _prefetch_wider_range(ticker: str, start_date: str, end_date: str):
+    """Populate the price cache with a padded window (runs on the fetch executor)."""
+    wide_start = (pd.Timestamp(start_date) - pd.Timedelta(days=_PREFETCH_PAD_DAYS)).strftime('%Y-%m-%d')
+    wide_key = f"{ticker}_{wide_start}_{end_date}"
+    if _cache["prices"].get(wide_key) is not None:
+        return
+    _fetch_prices(ticker, wide_start, end_date, wide_key)
+
+
+def _fetch_prices(ticker: str, start_date: str, end_date: str, cache_key: str) -> List[Price]:
+    """Fetch, transform, and cache one price window (runs on the fetch executor)."""
     try:
         logger.info(f"Fetching price data for {ticker} from {start_date} to {end_date}")
         # Use yfinance directly
-        ticker_data = yf.Ticker(ticker)
-        df = ticker_data.history(start=start_date, end=end_date)
+        ticker_data = _ticker(ticker)
+        # auto_adjust is passed explicitly so the single and batch paths
+        # share one adjustment policy regardless of yfinance defaults
+        df = ticker_data.history(start=start_date, end=end_date, auto_adjust=True)
         
         if df.empty:
             logger.warning(f"No price data found for {ticker}")
             return []
         
-        # Transform DataFrame to Price objects
-        prices = []
-        for date, row in df.iterrows():
-            price = Price(
-                open=float(row['Open']),
-                close=float(row['Close']),
-                high=float(row['High']),
-                low=float(row['Low']),
-                volume=int(row['Volume']),
-                time=date.strftime('%Y-%m-%d')
-            )
-            prices.append(price)
+        # Transform to Price objects through the columnar builder
+        prices = _price_series_from_df(df).to_list()
         
         # Cache the results
-        _cache["prices"][cache_key] = prices
+        _cache["prices"].put(cache_key, prices)
+        _register_price_range(ticker, start_date, end_date, cache_key)
         return prices
         
     except Exception as e:
@@ -76,6 +451,161 @@ def yf_get_prices(ticker: str, start_date: str, end_date: str) -> List[Price]:
         return []
 
 
+def _series_from_prices(prices: List[Price]) -> PriceSeries:
+    """Rebuild the columnar form from already-cached Price rows."""
+    count = len(prices)
+    return PriceSeries(
+        opens=np.fromiter((p.open for p in prices), dtype='float64', count=count),
+        highs=np.fromiter((p.high for p in prices), dtype='float64', count=count),
+        lows=np.fromiter((p.low for p in prices), dtype='float64', count=count),
+        closes=np.fromiter((p.close for p in prices), dtype='float64', count=count),
+        volumes=np.fromiter((p.volume for p in prices), dtype='int64', count=count),
+        times=[p.time for p in prices],
+    )
+
+
+def yf_get_price_series(ticker: str, start_date: DateLike, end_date: DateLike) -> PriceSeries:
+    """
+    Get historical price data as a columnar PriceSeries.
+
+    Callers that only need a few rows (or want to run array math over the
+    columns) avoid materializing one Price object per row; use
+    yf_get_prices() where a plain list is required.
+
+    Args:
+        ticker: Stock ticker symbol
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        PriceSeries (empty on failure)
+    """
+    start_date = _normalize_date(start_date)
+    end_date = _normalize_date(end_date)
+    cache_key = f"{ticker}_{start_date}_{end_date}"
+    cached = _cache["price_series"].get(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached price series for {ticker}")
+        return cached
+
+    # Serve from the shared list cache — exact key or a covering window —
+    # before touching the network; walk-forward callers request many small
+    # sub-windows of an already-prefetched range
+    prices = _cache["prices"].get(cache_key)
+    if prices is None:
+        prices = _covering_prices(ticker, start_date, end_date)
+    if prices is None:
+        # Full shared fetch path: disk cache, in-flight coalescing, and
+        # range registration all live behind yf_get_prices
+        prices = yf_get_prices(ticker, start_date, end_date)
+    if not prices:
+        return PriceSeries(np.empty(0), np.empty(0), np.empty(0), np.empty(0), np.empty(0, dtype='int64'), [])
+
+    series = _series_from_prices(prices)
+    _cache["price_series"].put(cache_key, series)
+    return series
+
+
+def yf_get_prices_frame(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Get historical price data as a DataFrame, skipping Price construction.
+
+    Built directly from the cached columnar arrays and shaped like
+    src.tools.api.prices_to_df output (lower-case OHLCV columns, DatetimeIndex
+    named Date), so indicator code can consume it without converting a
+    List[Price] back into columns.
+
+    Args:
+        ticker: Stock ticker symbol
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        DataFrame (empty on failure)
+    """
+    series = yf_get_price_series(ticker, start_date, end_date)
+    frame = pd.DataFrame({
+        'open': series.opens,
+        'close': series.closes,
+        'high': series.highs,
+        'low': series.lows,
+        'volume': series.volumes,
+        'time': series.times,
+    })
+    frame["Date"] = pd.to_datetime(frame["time"])
+    frame.set_index("Date", inplace=True)
+    frame.sort_index(inplace=True)
+    return frame
+
+
+def yf_get_prices_batch(tickers: List[str], start_date: DateLike, end_date: DateLike) -> Dict[str, List[Price]]:
+    """
+    Get historical price data for several tickers in one Yahoo Finance call.
+
+    yf.download() fans the per-ticker requests out over a thread pool and
+    returns a single frame, so N tickers cost roughly one round trip instead
+    of N sequential ones.
+
+    Args:
+        tickers: Stock ticker symbols
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        Mapping of ticker to list of Price objects (empty list on failure)
+    """
+    start_date = _normalize_date(start_date)
+    end_date = _normalize_date(end_date)
+    results: Dict[str, List[Price]] = {}
+    missing = []
+    for ticker in tickers:
+        cache_key = f"{ticker}_{start_date}_{end_date}"
+        cached = _cache["prices"].get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached price data for {ticker}")
+            results[ticker] = cached
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return results
+
+    try:
+        logger.info(f"Fetching price data for {len(missing)} tickers from {start_date} to {end_date}")
+        # Same explicit adjustment policy as the single-ticker history() path:
+        # both populate the same cache keys and range registry
+        df = yf.download(missing, start=start_date, end=end_date, group_by='ticker', threads=True, progress=False, auto_adjust=True)
+    except Exception as e:
+        logger.error(f"Error batch-fetching price data: {str(e)}")
+        for ticker in missing:
+            results[ticker] = []
+        return results
+
+    for ticker in missing:
+        try:
+            ticker_df = df[ticker] if isinstance(df.columns, pd.MultiIndex) else df
+            series = _price_series_from_df(ticker_df)
+
+            # Tickers missing from the response come back as all-NaN columns
+            if not len(series):
+                logger.warning(f"No price data found for {ticker}")
+                results[ticker] = []
+                continue
+
+            prices = series.to_list()
+
+            batch_key = f"{ticker}_{start_date}_{end_date}"
+            _cache["prices"].put(batch_key, prices)
+            _register_price_range(ticker, start_date, end_date, batch_key)
+            results[ticker] = prices
+        except Exception as e:
+            logger.error(f"Error processing price data for {ticker}: {str(e)}")
+            results[ticker] = []
+
+    return results
+
+
+@file_cached(endpoint="financial_metrics", ttl_days=30, model=FinancialMetrics)
 def yf_get_financial_metrics(
     ticker: str,
     end_date: Optional[str] = None,
@@ -94,33 +624,50 @@ def yf_get_financial_metrics(
     Returns:
         List of FinancialMetrics objects
     """
-    cache_key = ticker
-    if cache_key in _cache["financial_metrics"]:
+    # Key on the full argument identity: report_period is derived from
+    # end_date, so a ticker-only key could hand a caller another end_date's
+    # metrics — and the disk layer would then persist the mismatch
+    cache_key = f"{ticker}_{end_date}_{period}_{limit}"
+    cached = _cache["financial_metrics"].get(cache_key)
+    if cached is not None:
         logger.info(f"Using cached financial metrics for {ticker}")
-        return _cache["financial_metrics"][cache_key]
+        return cached
     
     try:
         logger.info(f"Fetching financial metrics for {ticker}")
-        ticker_data = yf.Ticker(ticker)
-        
-        # Get key statistics and financial data
-        info = ticker_data.info
-        
+        ticker_data = _ticker(ticker)
+
+        # get_info() returns the same quoteSummary payload as .info in the
+        # pinned yfinance, so take market cap and currency from it directly
+        # rather than paying an extra fast_info request on top
+        info = ticker_data.get_info()
+
         if not info:
             logger.warning(f"No financial metrics found for {ticker}")
             return []
+
+        market_cap = info.get('marketCap')
+        currency = info.get('currency')
         
         # Get the current date as report_period if end_date is not provided
         report_period = end_date if end_date else datetime.now().strftime('%Y-%m-%d')
+
+        # Scale the fraction-valued fields in one table-driven pass (single
+        # dict lookup per key) instead of a per-field branch chain
+        pct_fields = {attr: value * 100 if (value := info.get(key)) else None for attr, key in _PCT_FIELDS}
         
         # Create financial metrics object with data from Yahoo Finance
         # Map Yahoo Finance fields to our FinancialMetrics model
-        financial_metrics = FinancialMetrics(
-            ticker=ticker,
+        # The mapped values are already plain JSON scalars, so skip Pydantic
+        # validation of the 40+ fields
+        # Intern the low-cardinality strings: across a large ticker universe
+        # most rows share 'USD'/'ttm', so they collapse to one heap object each
+        financial_metrics = FinancialMetrics.model_construct(
+            ticker=sys.intern(ticker),
             report_period=report_period,
-            period=period,
-            currency=info.get('currency', 'USD'),
-            market_cap=info.get('marketCap'),
+            period=sys.intern(period),
+            currency=sys.intern(currency or 'USD'),
+            market_cap=market_cap,
             enterprise_value=info.get('enterpriseValue'),
             price_to_earnings_ratio=info.get('trailingPE'),
             price_to_book_ratio=info.get('priceToBook'),
@@ -129,11 +676,6 @@ def yf_get_financial_metrics(
             enterprise_value_to_revenue_ratio=info.get('enterpriseToRevenue'),
             free_cash_flow_yield=None,  # Not directly available from Yahoo Finance
             peg_ratio=info.get('pegRatio'),
-            gross_margin=info.get('grossMargins', 0) * 100 if info.get('grossMargins') else None,
-            operating_margin=info.get('operatingMargins', 0) * 100 if info.get('operatingMargins') else None,
-            net_margin=info.get('profitMargins', 0) * 100 if info.get('profitMargins') else None,
-            return_on_equity=info.get('returnOnEquity', 0) * 100 if info.get('returnOnEquity') else None,
-            return_on_assets=info.get('returnOnAssets', 0) * 100 if info.get('returnOnAssets') else None,
             return_on_invested_capital=None,  # Not directly available from Yahoo Finance
             asset_turnover=None,  # Not directly available from Yahoo Finance
             inventory_turnover=None,  # Not directly available from Yahoo Finance
@@ -148,21 +690,18 @@ def yf_get_financial_metrics(
             debt_to_equity=info.get('debtToEquity'),
             debt_to_assets=None,  # Not directly available from Yahoo Finance
             interest_coverage=None,  # Not directly available from Yahoo Finance
-            revenue_growth=info.get('revenueGrowth', 0) * 100 if info.get('revenueGrowth') else None,
-            earnings_growth=info.get('earningsGrowth', 0) * 100 if info.get('earningsGrowth') else None,
             book_value_growth=None,  # Not directly available from Yahoo Finance
-            earnings_per_share_growth=info.get('earningsQuarterlyGrowth', 0) * 100 if info.get('earningsQuarterlyGrowth') else None,
             free_cash_flow_growth=None,  # Not directly available from Yahoo Finance
             operating_income_growth=None,  # Not directly available from Yahoo Finance
             ebitda_growth=None,  # Not directly available from Yahoo Finance
-            payout_ratio=info.get('payoutRatio', 0) * 100 if info.get('payoutRatio') else None,
             earnings_per_share=info.get('trailingEps'),
             book_value_per_share=info.get('bookValue'),
             free_cash_flow_per_share=None,  # Not directly available from Yahoo Finance
+            **pct_fields,
         )
         
         # Cache the results as a list for consistency with the API
-        _cache["financial_metrics"][cache_key] = [financial_metrics]
+        _cache["financial_metrics"].put(cache_key, [financial_metrics])
         return [financial_metrics]
         
     except Exception as e:
@@ -170,6 +709,7 @@ def yf_get_financial_metrics(
         return []
 
 
+@file_cached(endpoint="insider_trades", ttl_days=90, model=InsiderTrade)
 def yf_get_insider_trades(
     ticker: str,
     end_date: str,
@@ -189,13 +729,14 @@ def yf_get_insider_trades(
         List of InsiderTrade objects
     """
     cache_key = f"{ticker}_{end_date}_{start_date}_{limit}"
-    if cache_key in _cache["insider_trades"]:
+    cached = _cache["insider_trades"].get(cache_key)
+    if cached is not None:
         logger.info(f"Using cached insider trades for {ticker}")
-        return _cache["insider_trades"][cache_key]
+        return cached
     
     try:
         logger.info(f"Fetching insider trades for {ticker}")
-        ticker_data = yf.Ticker(ticker)
+        ticker_data = _ticker(ticker)
         
         # Get insider transactions
         transactions_df = ticker_data.insider_transactions
@@ -204,58 +745,126 @@ def yf_get_insider_trades(
             logger.warning(f"No insider trades found for {ticker}")
             return []
         
-        # Convert transactions to InsiderTrade objects
-        insider_trades = []
-        for _, row in transactions_df.iterrows():
-            # Convert startDate to datetime for filtering
-            filing_date = row.get('startDate', '')
-            filing_date_str = filing_date.strftime('%Y-%m-%d') if isinstance(filing_date, pd.Timestamp) else ''
-            
-            # Apply date filtering if start_date or end_date are provided
-            if start_date and filing_date_str and filing_date_str < start_date:
-                continue
-            if end_date and filing_date_str and filing_date_str > end_date:
-                continue
-            
-            # Get transaction date
-            transaction_date = row.get('transactionDate', '')
-            transaction_date_str = transaction_date.strftime('%Y-%m-%d') if isinstance(transaction_date, pd.Timestamp) else ''
-            
-            # Create InsiderTrade object
-            insider_trade = InsiderTrade(
+        # Normalize dtypes once up front — datetime64 dates, NaN-free numeric
+        # columns — so nothing downstream needs per-value NA or type checks
+        df = transactions_df.assign(
+            startDate=pd.to_datetime(transactions_df['startDate'], errors='coerce'),
+            transactionDate=pd.to_datetime(transactions_df['transactionDate'], errors='coerce'),
+            shares=transactions_df['shares'].fillna(0).astype('float64'),
+            value=transactions_df['value'].fillna(0).astype('float64'),
+        )
+
+        # Filter with a boolean mask on the filing date and apply the limit
+        # before any InsiderTrade objects are built
+        filing_strs = df['startDate'].dt.strftime('%Y-%m-%d').fillna('')
+        transaction_strs = df['transactionDate'].dt.strftime('%Y-%m-%d').fillna('')
+
+        # Rows without a filing date pass through, as with the old per-row filter
+        mask = pd.Series(True, index=df.index)
+        if start_date:
+            mask &= (filing_strs == '') | (filing_strs >= start_date)
+        if end_date:
+            mask &= (filing_strs == '') | (filing_strs <= end_date)
+        df = df.loc[mask]
+        filing_strs = filing_strs.loc[mask]
+        transaction_strs = transaction_strs.loc[mask]
+        if limit:
+            df = df.iloc[:limit]
+            filing_strs = filing_strs.iloc[:limit]
+            transaction_strs = transaction_strs.iloc[:limit]
+
+        # Whole-column ops for the remaining fields
+        shares = df['shares']
+        values = df['value']
+        transaction_values = shares * values
+        names = df['filerName'].fillna('').astype(str)
+        titles = df['filerRelation'].fillna('').astype(str)
+        # Single substring scan: no lowered copy of the column, no regex engine
+        is_director = titles.str.contains('director', case=False, regex=False, na=False)
+
+        insider_trades = [
+            InsiderTrade(
                 ticker=ticker,
                 issuer=ticker,
-                name=row.get('filerName', ''),
-                title=row.get('filerRelation', ''),
-                is_board_director='director' in str(row.get('filerRelation', '')).lower(),
-                transaction_date=transaction_date_str,
-                transaction_shares=float(row.get('shares', 0)) if pd.notna(row.get('shares')) else 0,
-                transaction_price_per_share=float(row.get('value', 0)) if pd.notna(row.get('value')) else 0,
-                transaction_value=float(row.get('shares', 0) * row.get('value', 0)) if pd.notna(row.get('shares')) and pd.notna(row.get('value')) else 0,
+                name=n,
+                title=t,
+                is_board_director=bool(b),
+                transaction_date=td,
+                transaction_shares=float(s),
+                transaction_price_per_share=float(v),
+                transaction_value=float(tv),
                 shares_owned_before_transaction=None,
                 shares_owned_after_transaction=None,
                 security_title=None,
-                filing_date=filing_date_str
+                filing_date=fd
             )
-            insider_trades.append(insider_trade)
-        
-        # Limit the number of trades returned
-        limited_trades = insider_trades[:limit] if limit else insider_trades
-        
+            for n, t, b, td, s, v, tv, fd in zip(
+                names.to_numpy(), titles.to_numpy(), is_director.to_numpy(),
+                transaction_strs.to_numpy(), shares.to_numpy(), values.to_numpy(),
+                transaction_values.to_numpy(), filing_strs.to_numpy()
+            )
+        ]
+
         # Cache the results
-        _cache["insider_trades"][cache_key] = limited_trades
-        return limited_trades
+        _cache["insider_trades"].put(cache_key, insider_trades)
+        return insider_trades
         
     except Exception as e:
         logger.error(f"Error fetching insider trades for {ticker}: {str(e)}")
         return []
 
 
+async def yf_get_prices_async(ticker: str, start_date: str, end_date: str) -> List[Price]:
+    """Async variant of yf_get_prices; runs the blocking fetch in a worker thread."""
+    async with _async_sem():
+        return await asyncio.to_thread(yf_get_prices, ticker, start_date, end_date)
+
+
+async def yf_get_financial_metrics_async(
+    ticker: str,
+    end_date: Optional[str] = None,
+    period: str = "ttm",
+    limit: int = 10
+) -> List[FinancialMetrics]:
+    """Async variant of yf_get_financial_metrics; runs the blocking fetch in a worker thread."""
+    async with _async_sem():
+        return await asyncio.to_thread(yf_get_financial_metrics, ticker, end_date, period, limit)
+
+
+async def yf_get_insider_trades_async(
+    ticker: str,
+    end_date: str,
+    start_date: Optional[str] = None,
+    limit: int = 1000
+) -> List[InsiderTrade]:
+    """Async variant of yf_get_insider_trades; runs the blocking fetch in a worker thread."""
+    async with _async_sem():
+        return await asyncio.to_thread(yf_get_insider_trades, ticker, end_date, start_date, limit)
+
+
+async def gather_prices(tickers: List[str], start_date: str, end_date: str) -> Dict[str, List[Price]]:
+    """
+    Fetch price data for many tickers concurrently.
+
+    Recommended multi-ticker entry point for async callers: the per-ticker
+    network waits overlap (bounded by the module semaphore) while results
+    still flow through the normal per-ticker caches.
+    """
+    results = await asyncio.gather(*(yf_get_prices_async(ticker, start_date, end_date) for ticker in tickers))
+    return dict(zip(tickers, results))
+
+
 def clear_cache():
-    """Clear all cached data."""
+    """Clear all cached data, both in-memory and on disk."""
     _cache["prices"].clear()
     _cache["financial_metrics"].clear()
     _cache["line_items"].clear()
     _cache["market_cap"].clear()
     _cache["insider_trades"].clear()
+    _cache["price_series"].clear()
+    with _ranges_lock:
+        _price_ranges.clear()
+    _prefetched.clear()
+    _ticker.cache_clear()
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
     logger.info("Cleared Yahoo Finance cache")
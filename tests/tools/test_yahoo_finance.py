@@ -2,123 +2,141 @@
 Unit tests for the Yahoo Finance adapter module.
 """
 
-import unittest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.tools.yahoo_finance import yf_get_prices, clear_cache
-
-
-class TestYahooFinanceAdapter(unittest.TestCase):
-    """Test cases for Yahoo Finance adapter functions."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        clear_cache()
-        self.ticker = "AAPL"
-        self.end_date = datetime.now().strftime("%Y-%m-%d")
-        self.start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-
-    @patch('yfinance.Ticker')
-    def test_yf_get_prices_success(self, mock_ticker):
-        """Test successful price data retrieval."""
-        # Create mock Ticker instance
-        mock_ticker_instance = MagicMock()
-        mock_ticker.return_value = mock_ticker_instance
-        
-        # Create mock DataFrame with test data
-        mock_data = pd.DataFrame({
-            'Open': [150.0, 151.0, 152.0],
-            'High': [155.0, 156.0, 157.0],
-            'Low': [148.0, 149.0, 150.0],
-            'Close': [153.0, 154.0, 155.0],
-            'Volume': [1000000, 1100000, 1200000]
-        }, index=pd.date_range(self.start_date, periods=3, freq='D'))
-        
-        # Set up the mock to return our data
-        mock_ticker_instance.history.return_value = mock_data
-        
-        # Call the function
-        prices = yf_get_prices(self.ticker, self.start_date, self.end_date)
-        
-        # Verify results
-        self.assertEqual(len(prices), 3)
-        self.assertEqual(prices[0].open, 150.0)
-        self.assertEqual(prices[0].close, 153.0)
-        self.assertEqual(prices[0].high, 155.0)
-        self.assertEqual(prices[0].low, 148.0)
-        self.assertEqual(prices[0].volume, 1000000)
-        self.assertEqual(prices[0].time, pd.date_range(self.start_date, periods=1)[0].strftime('%Y-%m-%d'))
-
-    @patch('yfinance.Ticker')
-    def test_yf_get_prices_empty_data(self, mock_ticker):
-        """Test handling of empty data."""
-        # Create mock Ticker instance
-        mock_ticker_instance = MagicMock()
-        mock_ticker.return_value = mock_ticker_instance
-        
-        # Return empty DataFrame
-        mock_ticker_instance.history.return_value = pd.DataFrame()
-        
-        # Call the function
-        prices = yf_get_prices(self.ticker, self.start_date, self.end_date)
-        
-        # Verify results
-        self.assertEqual(len(prices), 0)
-
-    @patch('yfinance.Ticker')
-    def test_yf_get_prices_exception(self, mock_ticker):
-        """Test handling of exceptions."""
-        # Create mock Ticker instance
-        mock_ticker_instance = MagicMock()
-        mock_ticker.return_value = mock_ticker_instance
-        
-        # Raise an exception
-        mock_ticker_instance.history.side_effect = Exception("API error")
-        
-        # Call the function
-        prices = yf_get_prices(self.ticker, self.start_date, self.end_date)
-        
-        # Verify results
-        self.assertEqual(len(prices), 0)
-
-    @patch('yfinance.Ticker')
-    def test_yf_get_prices_caching(self, mock_ticker):
-        """Test that caching works properly."""
-        # Create mock Ticker instance
-        mock_ticker_instance = MagicMock()
-        mock_ticker.return_value = mock_ticker_instance
-        
-        # Create mock DataFrame with test data
-        mock_data = pd.DataFrame({
-            'Open': [150.0, 151.0, 152.0],
-            'High': [155.0, 156.0, 157.0],
-            'Low': [148.0, 149.0, 150.0],
-            'Close': [153.0, 154.0, 155.0],
-            'Volume': [1000000, 1100000, 1200000]
-        }, index=pd.date_range(self.start_date, periods=3, freq='D'))
-        
-        # Set up the mock to return our data
-        mock_ticker_instance.history.return_value = mock_data
-        
-        # First call should hit the API
-        prices1 = yf_get_prices(self.ticker, self.start_date, self.end_date)
-        
-        # Second call should use the cache
-        prices2 = yf_get_prices(self.ticker, self.start_date, self.end_date)
-        
-        # Verify the API was only called once
-        mock_ticker_instance.history.assert_called_once()
-        
-        # Verify both calls returned the same data
-        self.assertEqual(len(prices1), len(prices2))
-        for i in range(len(prices1)):
-            self.assertEqual(prices1[i].open, prices2[i].open)
-            self.assertEqual(prices1[i].close, prices2[i].close)
-
-
-if __name__ == '__main__':
-    unittest.main()
+import src.tools.yahoo_finance as yahoo_finance
+from src.tools.yahoo_finance import yf_get_prices, yf_get_prices_batch
+
+TICKER = "AAPL"
+_NOW = datetime.now()  # one clock read; both dates derive from it
+END_DATE = _NOW.strftime("%Y-%m-%d")
+START_DATE = (_NOW - timedelta(days=30)).strftime("%Y-%m-%d")
+
+# date_range parsing is surprisingly expensive; build the index (and the
+# expected time strings) once for the whole module
+_TEST_INDEX = pd.date_range(START_DATE, periods=3, freq='D')
+_TEST_TIMES = _TEST_INDEX.strftime('%Y-%m-%d').tolist()
+
+# Prebuilt narrow-dtype columns: half the bytes of inferred float64/int64,
+# and the frame can reference them without copying
+_TEST_OHLCV = {
+    'Open': np.array([150.0, 151.0, 152.0], dtype=np.float32),
+    'High': np.array([155.0, 156.0, 157.0], dtype=np.float32),
+    'Low': np.array([148.0, 149.0, 150.0], dtype=np.float32),
+    'Close': np.array([153.0, 154.0, 155.0], dtype=np.float32),
+    'Volume': np.array([1000000, 1100000, 1200000], dtype=np.int32),
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache(monkeypatch, tmp_path):
+    """Swap in fresh cache state per test; no filesystem work on the real cache dir."""
+    monkeypatch.setattr(yahoo_finance, "_cache", {name: yahoo_finance.BoundedCache() for name in yahoo_finance._cache})
+    monkeypatch.setattr(yahoo_finance, "_price_ranges", {})
+    monkeypatch.setattr(yahoo_finance, "_CACHE_DIR", tmp_path / ".cache")
+    yahoo_finance._ticker.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def mock_ohlcv():
+    """OHLCV frame shared by every test in the module; built once."""
+    return pd.DataFrame(_TEST_OHLCV, index=_TEST_INDEX, copy=False)
+
+
+def _ticker_stub(history_return=None, history_side_effect=None):
+    """Cheap yfinance.Ticker stand-in; SimpleNamespace beats MagicMock init cost."""
+    def history(**kwargs):
+        if history_side_effect is not None:
+            raise history_side_effect
+        return history_return
+    return SimpleNamespace(history=history)
+
+
+@pytest.mark.parametrize(
+    "history_return, history_side_effect, expected_len",
+    [
+        pytest.param("ohlcv", None, 3, id="success"),
+        pytest.param(pd.DataFrame(), None, 0, id="empty"),
+        pytest.param(None, Exception("API error"), 0, id="exception"),
+    ],
+)
+def test_yf_get_prices(history_return, history_side_effect, expected_len, mock_ohlcv, monkeypatch):
+    """Price retrieval across the success, empty-data, and error paths."""
+    frame = mock_ohlcv if isinstance(history_return, str) else history_return
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol, session=None: _ticker_stub(frame, history_side_effect))
+
+    prices = yf_get_prices(TICKER, START_DATE, END_DATE)
+
+    assert len(prices) == expected_len
+    if expected_len:
+        assert prices[0].open == 150.0
+        assert prices[0].close == 153.0
+        assert prices[0].high == 155.0
+        assert prices[0].low == 148.0
+        assert prices[0].volume == 1000000
+        assert prices[0].time == _TEST_TIMES[0]
+
+
+def test_batch_and_single_fetch_agree(monkeypatch):
+    """Both fetch paths must apply the same price-adjustment policy."""
+    def make_frame(auto_adjust):
+        # Adjusted closes differ from raw ones, as for any dividend payer;
+        # mismatched policies between the paths would surface here
+        factor = 0.9 if auto_adjust else 1.0
+        return pd.DataFrame({
+            'Open': _TEST_OHLCV['Open'] * factor,
+            'High': _TEST_OHLCV['High'] * factor,
+            'Low': _TEST_OHLCV['Low'] * factor,
+            'Close': _TEST_OHLCV['Close'] * factor,
+            'Volume': _TEST_OHLCV['Volume'],
+        }, index=_TEST_INDEX)
+
+    def history(**kwargs):
+        return make_frame(kwargs.get('auto_adjust', True))
+
+    def download(tickers, **kwargs):
+        # yf.download historically defaulted auto_adjust differently from
+        # Ticker.history, which is exactly the hazard under test
+        return pd.concat({t: make_frame(kwargs.get('auto_adjust', False)) for t in tickers}, axis=1)
+
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol, session=None: SimpleNamespace(history=history))
+    monkeypatch.setattr('yfinance.download', download)
+
+    # Separate tickers so the two paths cannot serve each other from cache
+    single = yf_get_prices(TICKER, START_DATE, END_DATE)
+    batch = yf_get_prices_batch(["MSFT"], START_DATE, END_DATE)["MSFT"]
+
+    np.testing.assert_array_equal(
+        np.fromiter((p.close for p in single), float),
+        np.fromiter((p.close for p in batch), float),
+    )
+
+
+def test_yf_get_prices_caching(mock_ohlcv, monkeypatch):
+    """Test that caching works properly."""
+    calls = {"count": 0}
+
+    def history(**kwargs):
+        calls["count"] += 1
+        return mock_ohlcv
+
+    monkeypatch.setattr('yfinance.Ticker', lambda symbol, session=None: SimpleNamespace(history=history))
+
+    # First call should hit the API, second should use the cache
+    prices1 = yf_get_prices(TICKER, START_DATE, END_DATE)
+    prices2 = yf_get_prices(TICKER, START_DATE, END_DATE)
+
+    assert calls["count"] == 1
+
+    assert len(prices1) == len(prices2)
+    # One bulk comparison per column instead of O(rows) assert calls
+    for field in ("open", "close", "high", "low", "volume"):
+        np.testing.assert_array_equal(
+            np.fromiter((getattr(p, field) for p in prices1), float),
+            np.fromiter((getattr(p, field) for p in prices2), float),
+        )